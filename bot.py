@@ -1,7 +1,5 @@
 import argparse
 
-from botcity.botcity_local import BotRunnerLocal
-from botcity.botcity_maestro import BotRunnerMaestro
 from core.config import settings
 
 
@@ -28,10 +26,16 @@ def parse_args() -> argparse.Namespace:
 def get_bot_runner(args):
     """
     Factory method to create the appropriate bot runner based on arguments.
+
+    Only the selected runner's module is imported.
     """
     if args.environment == settings.CHOICE_MAESTRO:
+        from botcity.botcity_maestro import BotRunnerMaestro
+
         return BotRunnerMaestro()
     else:
+        from botcity.botcity_local import BotRunnerLocal
+
         if (
             not settings.SERVER_MAESTRO
             or not settings.LOGIN_MAESTRO
@@ -0,0 +1,437 @@
+import atexit
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import pynvml
+from loguru import logger
+
+from core.bot_context import BotContext, SharePointCredentials
+from core.config import settings
+from core.logging import LoggerConfig
+from core.resource_sampler import ResourceSampler, ResourceUsage
+from core.sharepoint_wrapper import SharePointApi
+from src.main import main
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: pyodbc loads the ODBC driver manager, which is
+    # only needed when database logging is enabled
+    from core.sql_database_connector import SQLDatabaseConnectorDict
+
+
+class BotRunnerBase(ABC):
+    """
+    Base class with the behaviour shared by `BotRunnerMaestro` and `BotRunnerLocal`.
+
+    Subclasses set up `context` and `logger`, connect to BotMaestro, call
+    `_setup_runner` and implement `_fetch_credential` and `run`.
+
+    Responsibilities:
+        - Cache BotMaestro credentials and set up the SharePoint API.
+        - Sample CPU/RAM/GPU usage and format the execution time.
+        - Execute the main bot task.
+        - Upload logs to SharePoint and insert execution details into the SQL database.
+    """
+
+    # Whether the SQL log connection uses Windows Authentication
+    USE_WINDOWS_AUTH: bool = False
+
+    context: BotContext
+    logger: LoggerConfig
+
+    def _setup_runner(self) -> None:
+        """
+        Initializes the state shared by every runner, once BotMaestro is reachable.
+
+        Attributes:
+            sharepoint_credentials (SharePointCredentials): SharePoint credentials from BotMaestro.
+            sharepoint (SharePointApi): SharePoint API instance.
+            start_time (Optional[int]): Monotonic clock reading, in nanoseconds, when execution starts.
+            resource_sampler (Optional[ResourceSampler]): Sampler of the current attempt.
+        """
+        # credentials cache
+        self._credentials_cache: Dict[Tuple[str, str], str] = {}
+
+        # Sharepoint credentials
+        self.sharepoint_credentials: SharePointCredentials = (
+            self._get_credentials_sharepoint()
+        )
+
+        self.sharepoint = SharePointApi(
+            self.sharepoint_credentials.site_url
+            + settings.MAESTRO_SHAREPOINT_SITE_URL_SUFFIX,
+            self.sharepoint_credentials.username,
+            self.sharepoint_credentials.password,
+            self.context.log_folder,
+        )
+
+        # gpu config
+        self._nvml_handles: List = self._setup_nvml()
+
+        # time config
+        self.start_time: Optional[int] = None
+        self._last_execution_time: Tuple[int, str] = (-1, "")
+
+        # resource config
+        self.resource_sampler: Optional[ResourceSampler] = None
+
+        # database config (connected lazily on first insert)
+        self._sql_connector: Optional["SQLDatabaseConnectorDict"] = None
+        atexit.register(self._close_sql_connector)
+
+    def _setup_nvml(self) -> List:
+        """
+        Initializes NVML once and retrieves a handle for each available GPU.
+
+        NVML is shut down at interpreter exit. Hosts without an NVIDIA driver, or
+        whose GPUs cannot be listed (e.g. lost or hidden by a container), fall back
+        to an empty handle list, so GPU usage is simply not reported.
+
+        Returns:
+            List: NVML device handles, or an empty list if no GPU is available.
+        """
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError as e:
+            logger.info(f"NVML not available, GPU usage will not be tracked: {e}")
+            return []
+
+        atexit.register(pynvml.nvmlShutdown)
+
+        try:
+            return [
+                pynvml.nvmlDeviceGetHandleByIndex(index)
+                for index in range(pynvml.nvmlDeviceGetCount())
+            ]
+        except pynvml.NVMLError as e:
+            logger.warning(f"Failed to list GPUs, GPU usage will not be tracked: {e}")
+            return []
+
+    @abstractmethod
+    def _fetch_credential(self, label: str, key: str) -> str:
+        """
+        Fetches a credential from the BotMaestro server.
+
+        Args:
+            label (str): Credential label in BotMaestro.
+            key (str): Key inside the credential label.
+
+        Returns:
+            str: The credential value.
+        """
+
+    def _get_credential(self, label: str, key: str) -> str:
+        """
+        Retrieves a credential from BotMaestro, caching it for the lifetime of the runner.
+
+        Repeated lookups of the same label and key (e.g. on every retry) are served
+        from memory instead of issuing a new request to the BotMaestro server.
+
+        Args:
+            label (str): Credential label in BotMaestro.
+            key (str): Key inside the credential label.
+
+        Returns:
+            str: The credential value.
+        """
+        cache_key = (label, key)
+        if cache_key not in self._credentials_cache:
+            self._credentials_cache[cache_key] = self._fetch_credential(label, key)
+        return self._credentials_cache[cache_key]
+
+    def _get_credentials_sharepoint(self) -> SharePointCredentials:
+        """
+        Retrieves the SharePoint credentials from BotMaestro.
+
+        This method fetches the SharePoint site URL, username, and password from the BotMaestro
+
+        Returns:
+            SharePointCredentials: The SharePoint credentials.
+        """
+
+        credentials = SharePointCredentials(
+            site_url=self._get_credential(
+                label=settings.MAESTRO_SHAREPOINT_LABEL,
+                key=settings.MAESTRO_SHAREPOINT_SITE_URL,
+            ),
+            username=self._get_credential(
+                label=settings.MAESTRO_SHAREPOINT_LABEL,
+                key=settings.MAESTRO_SHAREPOINT_USERNAME,
+            ),
+            password=self._get_credential(
+                label=settings.MAESTRO_SHAREPOINT_LABEL,
+                key=settings.MAESTRO_SHAREPOINT_PASSWORD,
+            ),
+        )
+
+        return credentials
+
+    def _start_resource_sampler(self) -> None:
+        """
+        Starts a new background resource sampler for the current attempt.
+        """
+        self.resource_sampler = ResourceSampler(
+            self._nvml_handles, settings.RESOURCE_SAMPLING_INTERVAL
+        )
+        self.resource_sampler.start()
+
+    def _stop_resource_sampler(self) -> Optional[ResourceUsage]:
+        """
+        Stops the resource sampler of the current attempt, if one was started.
+
+        Calling it more than once is harmless; later calls return the same usage.
+
+        Returns:
+            Optional[ResourceUsage]: Usage collected during the attempt, or None if
+            no sampler was started.
+        """
+        if self.resource_sampler is None:
+            return None
+        return self.resource_sampler.stop()
+
+    def _get_execution_time(self) -> str:
+        """
+        Calculates execution duration since bot start.
+
+        Uses the monotonic clock, so the duration is not affected by system clock changes.
+
+        Returns:
+            str: Execution time formatted as 'DD:HH:MM:SS', or message if start_time is None.
+        """
+        if self.start_time is None:
+            return "Execution time not available"
+
+        elapsed_seconds = (time.monotonic_ns() - self.start_time) // 1_000_000_000
+
+        # Reuse the formatted value when called again within the same second
+        cached_seconds, cached_execution_time = self._last_execution_time
+        if cached_seconds == elapsed_seconds:
+            return cached_execution_time
+
+        days, remainder = divmod(elapsed_seconds, 86400)
+
+        execution_time = f"{days:02}:" + time.strftime(
+            "%H:%M:%S", time.gmtime(remainder)
+        )
+        self._last_execution_time = (elapsed_seconds, execution_time)
+        return execution_time
+
+    def _format_resource_usage(self, usage: Optional[ResourceUsage]) -> str:
+        """
+        Formats the resource usage returned by `_stop_resource_sampler`.
+
+        Args:
+            usage (Optional[ResourceUsage]): Usage collected during the attempt.
+
+        Returns:
+            str: CPU, RAM, and GPU usage as compact integer `key=value` pairs,
+            or message if no usage was collected. CPU usage is `n/a` when the
+            attempt was too short to measure it.
+        """
+        if usage is None:
+            return "Resource usage not available"
+
+        # Integers only (percent, KiB, MiB) to keep log lines short
+        ram_used_kib = usage.max_ram_used >> 10
+
+        # GPU usage (if GPU is available). Keys carry the GPU index and whitespace in
+        # device names is replaced by "_", so the line splits into unique `key=value` pairs
+        gpu_usage_str = (
+            " ".join(
+                f"gpu{index}={'_'.join(gpu.name.split())} gpu{index}_load={gpu.max_load}% "
+                f"gpu{index}_mem={gpu.max_memory_used >> 20}M/{gpu.memory_total >> 20}M"
+                for index, gpu in enumerate(usage.gpus)
+            )
+            if usage.gpus
+            else "gpu=none"
+        )
+
+        cpu_usage_str = (
+            f"cpu={round(usage.mean_cpu_percent)}% cpu_max={round(usage.max_cpu_percent)}%"
+            if usage.cpu_samples
+            else "cpu=n/a cpu_max=n/a"
+        )
+
+        # Format the usage information
+        usage_info = f"{cpu_usage_str} ram={round(usage.max_ram_percent)}% ram_used={ram_used_kib}k {gpu_usage_str}"
+        return usage_info
+
+    def _get_database_credentials(self) -> dict:
+        """
+        Retrieves the database credentials from BotMaestro.
+
+        Returns:
+            dict: A dictionary containing the database credentials.
+        """
+        credentials_database = {
+            "server": self._get_credential(
+                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_SERVER
+            ),
+            "database": self._get_credential(
+                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_DATABASE
+            ),
+            "username": self._get_credential(
+                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_USERNAME
+            ),
+            "password": self._get_credential(
+                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_PASSWORD
+            ),
+        }
+
+        return credentials_database
+
+    def _get_sql_connector(self) -> "SQLDatabaseConnectorDict":
+        """
+        Returns the runner's SQL connector, connecting on first use.
+
+        The connection is kept open for the lifetime of the runner so retries and
+        later inserts do not pay the login handshake again. It is closed at exit.
+
+        Returns:
+            SQLDatabaseConnectorDict: A connected SQL database connector.
+
+        Raises:
+            Exception: If the database connection fails.
+        """
+        if self._sql_connector is None:
+            from core.sql_database_connector import SQLDatabaseConnectorDict
+
+            credentials = self._get_database_credentials()
+
+            sql_connector = SQLDatabaseConnectorDict(
+                server=credentials.get("server", ""),
+                database=credentials.get("database", ""),
+                use_windows_auth=self.USE_WINDOWS_AUTH,
+                username=credentials.get("username"),
+                password=credentials.get("password"),
+            )
+
+            sql_connector.connect()
+            self._sql_connector = sql_connector
+
+        return self._sql_connector
+
+    def _close_sql_connector(self) -> None:
+        """
+        Disconnects and discards the runner's SQL connector, if one is open.
+        """
+        if self._sql_connector is not None:
+            sql_connector, self._sql_connector = self._sql_connector, None
+            sql_connector.disconnect()
+
+    def _insert_database_log_execution(self, items_processed: int):
+        """
+        Inserts an execution record into the automation logs database.
+
+        Fetches SQL credentials from BotMaestro, connects to the database, and
+        inserts a record including bot name, developer, sector, stakeholder,
+        recurrence, execution time, and items processed.
+
+        Args:
+            items_processed (int): Number of items processed in the bot task.
+
+        Raises:
+            Exception: If database connection or query execution fails.
+        """
+        from core.sql_database_connector import read_query_file
+
+        time = self._get_execution_time()
+
+        sql_connector = self._get_sql_connector()
+
+        params = [
+            self.context.bot_name,
+            self.context.developer,
+            self.context.sector,
+            self.context.stakeholder,
+            self.context.recurrence,
+            time,
+            items_processed,
+        ]
+
+        query = read_query_file(settings.SQL_QUERY_PATH)
+
+        try:
+            sql_connector.execute_query(query, params)
+        except RuntimeError:
+            # Drop a possibly broken connection so the next attempt reconnects
+            self._close_sql_connector()
+            raise
+
+    def _execute_bot_task(self) -> Optional[int]:
+        """
+        Executes the bot task and returns the number of processed items.
+
+        This method prepares the credentials, calls the `main` function to execute
+        the bot's main workflow, and returns the number of processed items. If the
+        task fails or produces no result, `None` can be returned.
+
+        Returns:
+            Optional[int]:
+                The number of items processed if successful, otherwise `None`.
+
+        Example:
+            >>> result = self._execute_bot_task()
+            >>> if result:
+            ...     print(f"Processed {result} items")
+            ... else:
+            ...     print("No items processed.")
+        """
+        credentials = {"example1": "credential_1", "example2": "credential_2"}
+
+        items_processed = main(credentials)
+        return items_processed
+
+    def _publish_execution_results(self, items_processed: Optional[int]) -> None:
+        """
+        Uploads the log file to SharePoint and inserts the database log concurrently.
+
+        Both operations are independent network calls, so they run in a thread pool
+        and the total wait is the slowest call rather than the sum of both.
+
+        Args:
+            items_processed (Optional[int]): Number of items processed in the bot task.
+
+        Raises:
+            RuntimeError: If any of the operations fails, listing every failure.
+        """
+        tasks: Dict[str, Tuple[Callable[..., None], Any]] = {}
+        if not settings.USE_DATABASE:
+            logger.info("Database logging is disabled.")
+        elif items_processed is None or items_processed <= 0:
+            logger.warning("No items processed or task failed.")
+        else:
+            logger.info(f"Items processed: {items_processed}")
+            tasks["Database log insertion"] = (
+                self._insert_database_log_execution,
+                items_processed,
+            )
+
+        # Flush after the logs above so the uploaded file includes them
+        self.logger.flush()
+        tasks["SharePoint log upload"] = (
+            self.sharepoint.upload_files,
+            [self.logger.log_path],
+        )
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                executor.submit(function, argument): name
+                for name, (function, argument) in tasks.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(f"{futures[future]} failed: {e}")
+
+        if errors:
+            raise RuntimeError("; ".join(errors))
+
+    @abstractmethod
+    def run(self) -> None:
+        """
+        Executes the bot task with retry logic.
+        """
@@ -1,24 +1,22 @@
 import time
-from typing import List, Optional, Tuple
+from typing import Dict, Tuple
 
-import GPUtil
-import psutil
 from loguru import logger
 
+from botcity.botcity_base import BotRunnerBase
 from botcity.maestro import (
     AutomationTaskFinishStatus,
     BotExecution,
     BotMaestroSDK,
     ServerMessage,
 )
+from core.bot_context import BotContext
 from core.config import settings
+from core.http_session import mount_http_session
 from core.logging import LoggerConfig
-from core.sharepoint_wrapper import SharePointApi
-from core.sql_database_connector import SQLDatabaseConnectorDict
-from src.main import main
 
 
-class BotRunnerMaestro:
+class BotRunnerMaestro(BotRunnerBase):
     """
     Class to handle execution of a BotCity bot with integration to BotMaestro,
     SharePoint, and optional database logging.
@@ -46,28 +44,24 @@ class BotRunnerMaestro:
             maestro (BotMaestroSDK): Configured BotMaestro SDK instance.
             execution (BotExecution): Current task execution object.
             sharepoint (SharePointApi): SharePoint API instance.
-            start_time (Optional[float]): Time when execution starts.
+            start_time (Optional[int]): Monotonic clock reading, in nanoseconds, when execution starts.
         """
         # initial config
-        self.logger: LoggerConfig = LoggerConfig(settings.BOT_NAME)
+        self.context: BotContext = BotContext.from_settings()
+        self.logger: LoggerConfig = LoggerConfig(self.context.bot_name)
+
+        # http config (keep-alive session shared by BotMaestro and SharePoint)
+        mount_http_session()
 
         # maestro config
         self.bot_maestro_sdk_raise: bool = bot_maestro_sdk_raise
         self.maestro, self.execution = self._setup_maestro()
 
-        # Sharepoint credentials
-        self.sharepoint_credentials = self._get_credentials_sharepoint()
-
-        self.sharepoint = SharePointApi(
-            self.sharepoint_credentials.get("site_url", "")
-            + settings.MAESTRO_SHAREPOINT_SITE_URL_SUFFIX,
-            self.sharepoint_credentials.get("username", ""),
-            self.sharepoint_credentials.get("password", ""),
-            settings.SHAREPOINT_DEPARTMENT_LOG_FOLDER,
-        )
+        # error reporting config ((task, error type, message) -> time it was sent)
+        self._reported_errors: Dict[Tuple[str, str, str], float] = {}
 
-        # time config
-        self.start_time: Optional[float] = None
+        # shared runner config (credentials, SharePoint, resources and database)
+        self._setup_runner()
 
     def _setup_maestro(self) -> Tuple[BotMaestroSDK, BotExecution]:
         """
@@ -95,32 +89,18 @@ class BotRunnerMaestro:
             logger.error(f"Failed to initialize BotMaestroSDK: {e}")
             raise e
 
-    def _get_credentials_sharepoint(self) -> dict:
+    def _fetch_credential(self, label: str, key: str) -> str:
         """
-        Retrieves the SharePoint credentials from BotMaestro.
+        Fetches a credential from the BotMaestro server of the current task.
 
-        This method fetches the SharePoint site URL, username, and password from the BotMaestro
+        Args:
+            label (str): Credential label in BotMaestro.
+            key (str): Key inside the credential label.
 
         Returns:
-            dict: A dictionary containing the SharePoint credentials.
+            str: The credential value.
         """
-
-        credentials = {
-            "site_url": self.maestro.get_credential(
-                label=settings.MAESTRO_SHAREPOINT_LABEL,
-                key=settings.MAESTRO_SHAREPOINT_SITE_URL,
-            ),
-            "username": self.maestro.get_credential(
-                label=settings.MAESTRO_SHAREPOINT_LABEL,
-                key=settings.MAESTRO_SHAREPOINT_USERNAME,
-            ),
-            "password": self.maestro.get_credential(
-                label=settings.MAESTRO_SHAREPOINT_LABEL,
-                key=settings.MAESTRO_SHAREPOINT_PASSWORD,
-            ),
-        }
-
-        return credentials
+        return self.maestro.get_credential(label=label, key=key)
 
     def _add_log_file_into_maestro(self) -> ServerMessage:
         """
@@ -133,6 +113,7 @@ class BotRunnerMaestro:
             Exception: If upload fails.
         """
         try:
+            self.logger.flush()
             response: ServerMessage = self.maestro.post_artifact(
                 task_id=int(self.execution.task_id),
                 artifact_name=self.logger.log_filename,
@@ -148,147 +129,32 @@ class BotRunnerMaestro:
             )
             raise e
 
-    def _get_execution_time(self) -> str:
-        """
-        Calculates execution duration since bot start.
-
-        Returns:
-            str: Execution time formatted as 'DD:HH:MM:SS', or message if start_time is None.
-        """
-        if self.start_time is None:
-            return "Execution time not available"
-
-        end_time = time.time()
-        elapsed_seconds = int(end_time - self.start_time)
-
-        days, remainder = divmod(elapsed_seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        execution_time = f"{days:02}:{hours:02}:{minutes:02}:{seconds:02}"
-        return execution_time
-
-    def _get_resource_usage(self) -> str:
-        """
-        Retrieves current system resource usage.
-
-        Returns:
-            str: Formatted CPU, RAM, and GPU usage.
-        """
-        # CPU and RAM usage
-        cpu_percent = psutil.cpu_percent(interval=1)
-        ram_usage = psutil.virtual_memory()
-        ram_percent = ram_usage.percent
-        ram_used_mb = ram_usage.used / (1024 * 1024)
-
-        # GPU usage (if GPU is available)
-        gpu_stats = []
-        gpus: List = GPUtil.getGPUs()
-        if gpus:
-            for gpu in gpus:
-                gpu_stats.append(
-                    f"GPU {gpu.id}: {gpu.name}, Load: {gpu.load * 100:.1f}%, "
-                    f"Memory: {gpu.memoryUsed}MB/{gpu.memoryTotal}MB"
-                )
-            gpu_usage_str = "; ".join(gpu_stats)
-        else:
-            gpu_usage_str = "No GPU found."
-
-        # Format the usage information
-        usage_info = f"CPU Usage: {cpu_percent}%, RAM Usage: {ram_percent}% ({ram_used_mb:.1f} MB), GPU Usage: {gpu_usage_str}"
-        return usage_info
-
-    def _get_database_credentials(self) -> dict:
+    def _report_error(self, error: Exception) -> None:
         """
-        Retrieves the database credentials from BotMaestro.
+        Reports an error to BotMaestro with the log file attached.
 
-        Returns:
-            dict: A dictionary containing the database credentials.
-        """
-        credentials_database = {
-            "server": self.maestro.get_credential(
-                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_SERVER
-            ),
-            "database": self.maestro.get_credential(
-                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_DATABASE
-            ),
-            "username": self.maestro.get_credential(
-                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_USERNAME
-            ),
-            "password": self.maestro.get_credential(
-                label=settings.MAESTRO_SQL_LABEL, key=settings.MAESTRO_SQL_PASSWORD
-            ),
-        }
-
-        return credentials_database
-
-    def _insert_database_log_execution(self, items_processed: int):
-        """
-        Inserts an execution record into the automation logs database.
-
-        Fetches SQL credentials from BotMaestro, connects to the database, and
-        inserts a record including bot name, developer, sector, stakeholder,
-        recurrence, execution time, and items processed.
+        Identical errors (same task, type and message) raised again within
+        `settings.ERROR_REPORT_TTL` seconds, e.g. on tight retry loops, are not
+        reported again.
 
         Args:
-            items_processed (int): Number of items processed in the bot task.
-
-        Raises:
-            Exception: If database connection or query execution fails.
+            error (Exception): The error raised during the bot execution.
         """
-        time = self._get_execution_time()
+        error_key = (self.execution.task_id, type(error).__name__, str(error))
 
-        credentials = self._get_database_credentials()
+        now = time.monotonic()
+        reported_at = self._reported_errors.get(error_key)
+        if reported_at is not None and now - reported_at < settings.ERROR_REPORT_TTL:
+            logger.info("Same error already reported to BotCity Maestro, skipping.")
+            return
 
-        sql_connector = SQLDatabaseConnectorDict(
-            server=credentials.get("server", ""),
-            database=credentials.get("database", ""),
-            use_windows_auth=False,
-            username=credentials.get("username"),
-            password=credentials.get("password"),
+        self.logger.flush()
+        self.maestro.error(
+            int(self.execution.task_id),
+            error,
+            attachments=[self.logger.log_path],
         )
-
-        sql_connector.connect()
-
-        params = [
-            settings.BOT_NAME,
-            settings.DEVELOPER,
-            settings.SECTOR,
-            settings.STAKEHOLDER,
-            settings.RECURRENCE,
-            time,
-            items_processed,
-        ]
-
-        query = settings.SQL_QUERY_PATH
-
-        sql_connector.execute_query_from_file(query, params)
-
-        sql_connector.disconnect()
-
-    def _execute_bot_task(self) -> Optional[int]:
-        """
-        Executes the bot task and returns the number of processed items.
-
-        This method prepares the credentials, calls the `main` function to execute
-        the bot's main workflow, and returns the number of processed items. If the
-        task fails or produces no result, `None` can be returned.
-
-        Returns:
-            Optional[int]:
-                The number of items processed if successful, otherwise `None`.
-
-        Example:
-            >>> result = self._execute_bot_task()
-            >>> if result:
-            ...     print(f"Processed {result} items")
-            ... else:
-            ...     print("No items processed.")
-        """
-        credentials = {"example1": "credential_1", "example2": "credential_2"}
-
-        items_processed = main(credentials)
-        return items_processed
+        self._reported_errors[error_key] = now
 
     def run(self) -> None:
         """
@@ -297,75 +163,86 @@ class BotRunnerMaestro:
         - Attempts the task up to `settings.MAX_RETRIES`.
         - Logs execution time, CPU/RAM/GPU usage, and errors.
         - Uploads logs to SharePoint and BotMaestro.
-        - Inserts execution details into SQL database if enabled.
+        - Inserts execution details into SQL database if enabled, once the task succeeded.
         - Marks the task as SUCCESS or FAILED in BotMaestro.
 
+        The task is only retried when it fails itself. If publishing the results of a
+        successful attempt fails, the error is reported and the task is still marked
+        as SUCCESS.
+
         Raises:
-            Exception: If bot execution fails after all retries.
+            Exception: If bot execution fails after all retries, or if publishing
+                the execution results fails.
         """
         attempts = 0
-        while attempts <= settings.MAX_RETRIES:
-            try:
-                self.start_time = time.time()
-                logger.info(f"Bot execution started. Attempt {attempts}")
+        try:
+            while attempts <= settings.MAX_RETRIES:
+                try:
+                    self.start_time = time.monotonic_ns()
+                    self._start_resource_sampler()
+                    logger.info(f"Bot execution started. Attempt {attempts}")
 
-                items_processed = self._execute_bot_task()
+                    items_processed = self._execute_bot_task()
 
-                execution_time = self._get_execution_time()
-                resource_usage = self._get_resource_usage()
+                    execution_time = self._get_execution_time()
+                    resource_usage = self._format_resource_usage(
+                        self._stop_resource_sampler()
+                    )
 
-                logger.info(
-                    f"{settings.BOT_NAME} Bot execution completed on attempt {attempts}."
-                )
-                logger.info(f"Execution time: {execution_time}")
-                logger.info(f"Resource usage at end of execution: {resource_usage}")
+                    logger.info(
+                        f"{self.context.bot_name} Bot execution completed on attempt {attempts}."
+                    )
+                    logger.info(f"Execution time: {execution_time}")
+                    logger.info(
+                        f"Peak resource usage during execution: {resource_usage}"
+                    )
 
-                self.sharepoint.list_folders_by_number()
-                self.sharepoint.upload_files([rf"{self.logger.log_path}"])
-                if not settings.USE_DATABASE:
-                    logger.info("Database logging is disabled.")
-                elif items_processed is None or items_processed <= 0:
-                    logger.warning("No items processed or task failed.")
-                else:
-                    logger.info(f"Items processed: {items_processed}")
-                    self._insert_database_log_execution(items_processed)
+                    break
 
-                success_message = f"""Execution time: {execution_time}\nResource usage at end of execution: {resource_usage}"""
+                except Exception as e:
+                    attempts += 1
+                    logger.error(
+                        f"An error occurred during bot '{self.context.bot_name}' execution: {e}"
+                    )
 
-                self.maestro.finish_task(
-                    self.execution.task_id,
-                    AutomationTaskFinishStatus.SUCCESS,
-                    success_message,
-                )
+                    self._report_error(e)
 
-                break
+                    self.maestro.finish_task(
+                        self.execution.task_id,
+                        AutomationTaskFinishStatus.FAILED,
+                        f"An error occurred during bot execution: {e}",
+                    )
 
-            except Exception as e:
-                attempts += 1
-                logger.error(
-                    f"An error occurred during bot '{settings.BOT_NAME}' execution: {e}"
-                )
+                    if attempts > settings.MAX_RETRIES:
+                        logger.error(
+                            f"Max retries reached ({settings.MAX_RETRIES}). Giving up."
+                        )
+                        self.logger.flush()
+                        self.sharepoint.upload_files([self.logger.log_path])
+                        raise e
 
-                self.maestro.error(
-                    int(self.execution.task_id), e, attachments=[self.logger.log_path]
-                )
+                    else:
+                        logger.info(f"Retrying bot execution (attempt {attempts})...")
 
+                finally:
+                    self._stop_resource_sampler()
+
+            # Published once, after the task succeeded: a publishing failure must
+            # not re-run the task nor insert its database log twice
+            success_message = f"""Execution time: {execution_time}\nPeak resource usage during execution: {resource_usage}"""
+            try:
+                self._publish_execution_results(items_processed)
+            except Exception as e:
+                logger.error(f"Failed to publish execution results: {e}")
+                self._report_error(e)
+                success_message += f"\nFailed to publish execution results: {e}"
+                raise e
+            finally:
                 self.maestro.finish_task(
                     self.execution.task_id,
-                    AutomationTaskFinishStatus.FAILED,
-                    f"An error occurred during bot execution: {e}",
+                    AutomationTaskFinishStatus.SUCCESS,
+                    success_message,
                 )
-
-                if attempts > settings.MAX_RETRIES:
-                    logger.error(
-                        f"Max retries reached ({settings.MAX_RETRIES}). Giving up."
-                    )
-                    self.sharepoint.list_folders_by_number()
-                    self.sharepoint.upload_files([rf"{self.logger.log_path}"])
-                    raise e
-
-                else:
-                    logger.info(f"Retrying bot execution (attempt {attempts})...")
-
-            finally:
-                self._add_log_file_into_maestro()
+        finally:
+            # Upload the log once per run, after the final attempt
+            self._add_log_file_into_maestro()
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+from core.config import settings
+
+
+@dataclass(slots=True, frozen=True)
+class SharePointCredentials:
+    """
+    SharePoint credentials fetched from BotMaestro.
+
+    Attributes:
+        site_url (str): URL of the SharePoint site, without the site suffix.
+        username (str): SharePoint account username.
+        password (str): SharePoint account password.
+    """
+
+    site_url: str
+    username: str
+    password: str
+
+
+@dataclass(slots=True, frozen=True)
+class BotContext:
+    """
+    Metadata describing the bot, shared by logging, SharePoint and the database log.
+
+    Attributes:
+        bot_name (str): Name of the bot.
+        developer (str): Developer responsible for the bot.
+        sector (str): Department the automation is built for.
+        stakeholder (str): Stakeholder of the automation.
+        recurrence (str): How often the automation runs.
+        log_folder (str): SharePoint department log folder number.
+    """
+
+    bot_name: str
+    developer: str
+    sector: str
+    stakeholder: str
+    recurrence: str
+    log_folder: str
+
+    @classmethod
+    def from_settings(cls) -> "BotContext":
+        """
+        Builds the bot context from the application settings.
+
+        Returns:
+            BotContext: The context of the configured bot.
+        """
+        return cls(
+            bot_name=settings.BOT_NAME,
+            developer=settings.DEVELOPER,
+            sector=settings.SECTOR,
+            stakeholder=settings.STAKEHOLDER,
+            recurrence=settings.RECURRENCE,
+            log_folder=settings.SHAREPOINT_DEPARTMENT_LOG_FOLDER,
+        )
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
         DepartmentName.OUVIDORIA
     )  # Change this to whatever department the automation is being builded for
     MAX_RETRIES: int = 0
+    RESOURCE_SAMPLING_INTERVAL: float = 5.0  # Seconds between resource usage samples
+    ERROR_REPORT_TTL: float = (
+        300.0  # Seconds during which an identical error is reported once
+    )
 
     # =============================
     # Bot Local Settings
@@ -38,6 +42,14 @@ class Settings(BaseSettings):
     CHOICE_MAESTRO: str = "maestro"
     CHOICE_LOCAL: str = "local"
 
+    # =============================
+    # HTTP settings
+    # =============================
+    HTTP_POOL_CONNECTIONS: int = 4
+    HTTP_POOL_MAXSIZE: int = 8
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_FACTOR: float = 0.3
+
     # =============================
     # Database settings
     # =============================
@@ -59,6 +71,7 @@ class Settings(BaseSettings):
 
     MAESTRO_SHAREPOINT_SITE_URL_SUFFIX: str = "TIeDesenvolvimento"
     SHAREPOINT_ROOT_LOG_FOLDER: str = r"Documentos Compartilhados/Automações/Logs"
+    SHAREPOINT_UPLOAD_MAX_WORKERS: int = 8
     SHAREPOINT_DEPARTMENT_LOG_FOLDER: str = (
         DepartmentFolderNumber.ADM_GRUPOS
     )  # Change this to whatever department the automation is being builded for
@@ -0,0 +1,107 @@
+import importlib
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.config import settings
+
+# SDK modules that issue their HTTP calls through the module-level `requests` API.
+_SDK_MODULES = (
+    "botcity.maestro.sdk",
+    "botcity.maestro.datapool.datapool",
+    "office365.runtime.client_request",
+)
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Creates a `requests.Session` with a pooled keep-alive adapter.
+
+    Transient failures are retried with exponential backoff on the pooled connection.
+    urllib3 only retries non-idempotent requests (e.g. uploads) when the connection
+    could not be established, so a request is never sent twice.
+
+    Cookies are never stored in the session, as with the module-level `requests` API,
+    so BotMaestro and SharePoint calls do not share cookies.
+
+    Returns:
+        requests.Session: Session whose connections are reused across requests.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=settings.HTTP_MAX_RETRIES,
+            backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ThreadLocalSession:
+    """
+    Stand-in for the `requests` module that sends each call through a session owned
+    by the calling thread.
+
+    `requests.Session` is not thread-safe, and the SharePoint uploads and database
+    log run on worker threads, so every thread gets its own pooled session.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the stand-in without creating any session.
+        """
+        self._thread_local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the calling thread's session, creating it on first use.
+
+        Returns:
+            requests.Session: The calling thread's session.
+        """
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = _create_http_session()
+            self._thread_local.session = session
+        return session
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Resolves `get`, `post` and the other request methods on the calling
+        thread's session.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            Any: The attribute of the calling thread's session.
+        """
+        return getattr(self.session, name)
+
+
+http_session: ThreadLocalSession = ThreadLocalSession()
+
+
+def mount_http_session() -> None:
+    """
+    Routes the BotMaestro and SharePoint SDK requests through the shared `http_session`.
+
+    Both SDKs call `requests.get`/`requests.post` directly, opening a new TCP and TLS
+    connection per call. Replacing their `requests` reference with `http_session`
+    makes every call reuse the pooled keep-alive connections of its thread instead.
+
+    Must be called before the first SDK request to benefit the whole execution.
+    """
+    for module_name in _SDK_MODULES:
+        module = importlib.import_module(module_name)
+        setattr(module, "requests", http_session)
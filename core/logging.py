@@ -6,6 +6,9 @@ from loguru import logger
 
 from core.config import settings
 
+# Size of the in-memory buffer for the log file, flushed by `LoggerConfig.flush`
+LOG_BUFFER_SIZE = 64 * 1024
+
 
 class LoggerConfig:
     """
@@ -76,20 +79,43 @@ class LoggerConfig:
         Configures the Loguru logger to use the created log file and rotate it every 10 MB.
 
         This method sets up the Loguru logger to log messages to a file with rotation, ensuring that
-        the log files are not too large.
+        the log files are not too large. Records are handed to a background thread and written
+        through an in-memory buffer, so logging does not issue a write syscall per record.
 
         Raises:
             Exception: If the logger setup fails.
         """
         try:
             # Add log file with rotation
-            logger.add(self.log_path, rotation="10 MB", colorize=False, encoding="utf8")
+            self._handler_id: int = logger.add(
+                self.log_path,
+                rotation="10 MB",
+                colorize=False,
+                encoding="utf8",
+                enqueue=True,
+                buffering=LOG_BUFFER_SIZE,
+            )
         except Exception as e:
             logger.error(
                 f"Failed to set up logger with path {self.log_path}. Error: {str(e)}"
             )
             raise e
 
+    def flush(self) -> None:
+        """
+        Writes every pending log record to the log file.
+
+        Must be called before the log file is read, copied or uploaded, since records are
+        queued and buffered in memory. Waits for the queue to drain and re-adds the file
+        sink, which flushes and closes the buffered file.
+
+        Raises:
+            Exception: If the logger setup fails.
+        """
+        logger.complete()
+        logger.remove(self._handler_id)
+        self._setup_logger()
+
     def copy_log_file(self, destination_dir: str) -> None:
         """
         Copies the log file to a specified destination directory.
@@ -101,6 +127,8 @@ class LoggerConfig:
             Exception: If an error occurs while copying the log file.
         """
         try:
+            self.flush()
+
             destination_path = Path(destination_dir) / self.log_filename
 
             # Ensure the destination directory exists
@@ -0,0 +1,180 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import psutil
+import pynvml
+from loguru import logger
+
+# Shortest interval, in seconds, over which a CPU percentage is meaningful
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+
+@dataclass
+class GPUUsage:
+    """
+    Aggregated usage of a single GPU over the sampled period.
+
+    Attributes:
+        name (str): Device name reported by NVML.
+        max_load (int): Highest GPU utilization observed, in percent.
+        max_memory_used (int): Highest memory usage observed, in bytes.
+        memory_total (int): Total device memory, in bytes.
+    """
+
+    name: str
+    max_load: int = 0
+    max_memory_used: int = 0
+    memory_total: int = 0
+
+
+@dataclass
+class ResourceUsage:
+    """
+    Aggregated CPU, RAM and GPU usage collected by a `ResourceSampler`.
+
+    Attributes:
+        samples (int): Number of samples taken.
+        cpu_samples (int): Number of samples that include CPU usage. CPU usage is
+            skipped when measured over less than `MIN_CPU_SAMPLE_INTERVAL` seconds.
+        cpu_percent_total (float): Sum of all CPU samples, used to compute the mean.
+        max_cpu_percent (float): Highest CPU usage observed, in percent.
+        max_ram_percent (float): Highest RAM usage observed, in percent.
+        max_ram_used (int): Highest RAM usage observed, in bytes.
+        gpus (List[GPUUsage]): Per-GPU aggregates, in NVML index order.
+    """
+
+    samples: int = 0
+    cpu_samples: int = 0
+    cpu_percent_total: float = 0.0
+    max_cpu_percent: float = 0.0
+    max_ram_percent: float = 0.0
+    max_ram_used: int = 0
+    gpus: List[GPUUsage] = field(default_factory=list)
+
+    @property
+    def mean_cpu_percent(self) -> float:
+        """
+        Mean CPU usage across all samples.
+
+        Returns:
+            float: Mean CPU usage in percent, or 0.0 if no CPU usage was sampled.
+        """
+        if not self.cpu_samples:
+            return 0.0
+        return self.cpu_percent_total / self.cpu_samples
+
+
+class ResourceSampler(threading.Thread):
+    """
+    Daemon thread that periodically samples CPU, RAM and GPU usage while the bot runs.
+
+    Sampling overlaps with the bot task, so reporting the usage at the end of an
+    execution is a read of the collected aggregates instead of a blocking measurement.
+
+    Attributes:
+        nvml_handles (List): NVML device handles to sample, empty if no GPU is available.
+        period (float): Seconds between two samples.
+        usage (ResourceUsage): Aggregates collected so far.
+    """
+
+    def __init__(self, nvml_handles: List, period: float) -> None:
+        """
+        Initializes the sampler without starting it.
+
+        Args:
+            nvml_handles (List): NVML device handles to sample.
+            period (float): Seconds between two samples.
+        """
+        super().__init__(name="ResourceSampler", daemon=True)
+        self.nvml_handles = nvml_handles
+        self.period = period
+        self.usage = ResourceUsage(
+            gpus=[
+                GPUUsage(name=self._get_device_name(handle)) for handle in nvml_handles
+            ]
+        )
+        self._stop_event = threading.Event()
+        self._last_cpu_sample: Optional[float] = None
+
+    @staticmethod
+    def _get_device_name(handle) -> str:
+        """
+        Reads the name of a GPU, without letting an NVML error reach the bot.
+
+        Args:
+            handle: NVML device handle.
+
+        Returns:
+            str: Device name reported by NVML, or "unknown" if it cannot be read.
+        """
+        try:
+            return pynvml.nvmlDeviceGetName(handle)
+        except Exception as e:
+            logger.warning(f"Failed to read GPU name: {e}")
+            return "unknown"
+
+    def run(self) -> None:
+        """
+        Primes the CPU counter and samples every `period` seconds until stopped.
+        """
+        psutil.cpu_percent(interval=None)
+        self._last_cpu_sample = time.monotonic()
+        while not self._stop_event.wait(self.period):
+            self._sample()
+
+    def stop(self) -> ResourceUsage:
+        """
+        Stops the sampler, taking one last sample to cover the remaining interval.
+
+        Calling it more than once is harmless; only the first call samples.
+
+        Returns:
+            ResourceUsage: The aggregates collected during the run.
+        """
+        if not self._stop_event.is_set():
+            self._stop_event.set()
+            self.join()
+            self._sample()
+        return self.usage
+
+    def _sample(self) -> None:
+        """
+        Takes a single non-blocking sample and folds it into `usage`.
+
+        CPU usage is measured since the previous CPU sample, so it is skipped when
+        less than `MIN_CPU_SAMPLE_INTERVAL` seconds have passed, e.g. when the
+        sampler is stopped right after it started.
+        """
+        try:
+            now = time.monotonic()
+            if (
+                self._last_cpu_sample is not None
+                and now - self._last_cpu_sample >= MIN_CPU_SAMPLE_INTERVAL
+            ):
+                cpu_percent = psutil.cpu_percent(interval=None)
+                self._last_cpu_sample = now
+
+                self.usage.cpu_samples += 1
+                self.usage.cpu_percent_total += cpu_percent
+                self.usage.max_cpu_percent = max(
+                    self.usage.max_cpu_percent, cpu_percent
+                )
+
+            ram_usage = psutil.virtual_memory()
+
+            self.usage.samples += 1
+            self.usage.max_ram_percent = max(
+                self.usage.max_ram_percent, ram_usage.percent
+            )
+            self.usage.max_ram_used = max(self.usage.max_ram_used, ram_usage.used)
+
+            for gpu, handle in zip(self.usage.gpus, self.nvml_handles):
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                gpu.max_load = max(gpu.max_load, utilization.gpu)
+                gpu.max_memory_used = max(gpu.max_memory_used, memory.used)
+                gpu.memory_total = memory.total
+        except Exception as e:
+            logger.warning(f"Failed to sample resource usage: {e}")
@@ -1,6 +1,8 @@
 import os
 import re
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
 
 from loguru import logger
 from office365.sharepoint.client_context import ClientContext, UserCredential
@@ -42,6 +44,7 @@ class SharePointApi:
         self.ctx = ClientContext(site_url).with_credentials(
             credentials=UserCredential(username, password)
         )
+        self._thread_local = threading.local()
 
     def list_folders_by_number(self) -> List:
         """
@@ -103,16 +106,18 @@ class SharePointApi:
 
     def upload_files(self, file_paths: List[str]) -> None:
         """
-        Retrieves all file names from a specified subfolder in SharePoint.
+        Uploads files to the bot's subfolder inside the department log folder.
 
-        Args:
-            folder_name (str): Name of the folder to list files from (e.g., '10 - Logs').
+        The subfolder is created if needed and files whose names already exist are
+        renamed with a numeric suffix. Files are uploaded concurrently by a bounded
+        thread pool; failed files are retried as long as at least half of the previous
+        round succeeded.
 
-        Returns:
-            List[str]: List of file names within the specified folder.
+        Args:
+            file_paths (List[str]): Local paths of the files to upload.
 
         Raises:
-            Exception: If an error occurs while accessing the folder or loading files.
+            Exception: If an error occurs while accessing the folder or uploading files.
         """
         try:
             matching_folders = self.list_folders_by_number()
@@ -150,11 +155,12 @@ class SharePointApi:
                 target_folder_path
             )
 
-            files = target_folder.files
-            self.ctx.load(files)
+            remote_files = target_folder.files
+            self.ctx.load(remote_files)
             self.ctx.execute_query()
-            existing_files = [f.name for f in files]
+            existing_files = {f.name for f in remote_files}
 
+            pending_uploads = []
             for file_path in file_paths:
                 base_name = os.path.basename(file_path)
                 name, ext = os.path.splitext(base_name)
@@ -165,14 +171,109 @@ class SharePointApi:
                     final_name = f"{name}({counter}){ext}"
                     counter += 1
 
-                with open(file_path, "rb") as f:
-                    file_content = f.read()
-                    target_folder.upload_file(final_name, file_content)
-                    self.ctx.execute_query()
-                    logger.info(
-                        f"File '{final_name}' successfully uploaded to '{target_folder_path}'."
+                existing_files.add(final_name)
+                pending_uploads.append((file_path, final_name))
+
+            while pending_uploads:
+                failed_uploads = self._upload_batch(target_folder_path, pending_uploads)
+                if len(failed_uploads) * 2 > len(pending_uploads):
+                    raise Exception(
+                        f"{len(failed_uploads)} of {len(pending_uploads)} file(s) failed to upload."
                     )
+                pending_uploads = failed_uploads
 
         except Exception as e:
             logger.error(f"Error while uploading files to the bot's subfolder: {e}")
             raise
+
+    def _upload_batch(
+        self, folder_path: str, uploads: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Uploads a batch of files concurrently, with at most
+        `settings.SHAREPOINT_UPLOAD_MAX_WORKERS` uploads in flight.
+
+        Each worker reads its own file, so memory stays bounded by the number of workers.
+        A single file is uploaded directly on the main client context.
+
+        Args:
+            folder_path (str): Server relative URL of the target folder.
+            uploads (List[Tuple[str, str]]): Pairs of local file path and target file name.
+
+        Returns:
+            List[Tuple[str, str]]: The uploads that failed.
+        """
+        if len(uploads) == 1:
+            file_path, final_name = uploads[0]
+            try:
+                self._upload_file(folder_path, file_path, final_name, self.ctx)
+                return []
+            except Exception as e:
+                logger.warning(f"Failed to upload file '{final_name}': {e}")
+                return uploads
+
+        failed_uploads = []
+        max_workers = min(settings.SHAREPOINT_UPLOAD_MAX_WORKERS, len(uploads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._upload_file, folder_path, file_path, final_name
+                ): (file_path, final_name)
+                for file_path, final_name in uploads
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to upload file '{futures[future][1]}': {e}")
+                    failed_uploads.append(futures[future])
+
+        return failed_uploads
+
+    def _upload_file(
+        self,
+        folder_path: str,
+        file_path: str,
+        final_name: str,
+        ctx: Optional[ClientContext] = None,
+    ) -> None:
+        """
+        Uploads a single file to a SharePoint folder.
+
+        Args:
+            folder_path (str): Server relative URL of the target folder.
+            file_path (str): Local path of the file to upload.
+            final_name (str): Name of the file in SharePoint.
+            ctx (Optional[ClientContext]): Client context to use. Defaults to the
+                calling thread's context.
+
+        Raises:
+            Exception: If the upload fails.
+        """
+        ctx = ctx or self._get_thread_context()
+        folder = ctx.web.get_folder_by_server_relative_url(folder_path)
+
+        with open(file_path, "rb") as f:
+            folder.upload_file(final_name, f.read())
+        ctx.execute_query()
+
+        logger.info(f"File '{final_name}' successfully uploaded to '{folder_path}'.")
+
+    def _get_thread_context(self) -> ClientContext:
+        """
+        Returns a client context owned by the calling thread.
+
+        `ClientContext` queues pending queries and is not thread-safe, so each upload
+        worker gets its own context. It shares the authentication of `ctx`, so no
+        new login is performed.
+
+        Returns:
+            ClientContext: The calling thread's client context.
+        """
+        ctx = getattr(self._thread_local, "ctx", None)
+        if ctx is None:
+            ctx = ClientContext(
+                self.site_url, auth_context=self.ctx.authentication_context
+            )
+            self._thread_local.ctx = ctx
+        return ctx
@@ -11,6 +11,9 @@ Dependencies:
 Classes:
     SQLDatabaseConnectorDict: A class that handles connection to a SQL Server database and supports executing SQL queries, returning results as dictionaries.
 
+Functions:
+    read_query_file: Reads a SQL file once and returns its cached contents on later calls.
+
 Usage Example:
     >>> from sql_server_pyodbc_dict import SQLDatabaseConnectorDict
 
@@ -31,12 +34,35 @@ Usage Example:
     >>> sql_connector.disconnect()
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 import pyodbc
 from loguru import logger
 
 
+@lru_cache(maxsize=None)
+def read_query_file(file_path: str) -> str:
+    """
+    Reads a SQL query from a file, caching the contents for subsequent calls.
+
+    Queries executed repeatedly (e.g. on every bot run or retry) are read from disk
+    only once per process.
+
+    Args:
+        file_path (str): The path to the SQL file containing the query.
+
+    Returns:
+        str: The SQL query text.
+
+    Raises:
+        FileNotFoundError: If the SQL file does not exist.
+    """
+    logger.debug(f"Reading SQL query from file: {file_path}")
+    with open(file_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
 class SQLDatabaseConnectorDict:
     """
     A class to manage connection to a Microsoft SQL Server database using PyODBC and to execute SQL queries,
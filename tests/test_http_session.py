@@ -0,0 +1,60 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from core.http_session import ThreadLocalSession
+
+
+class _SetCookieHandler(BaseHTTPRequestHandler):
+    """
+    Answers every GET with a cookie and records the cookies it receives.
+    """
+
+    received_cookies: list = []
+
+    def do_GET(self) -> None:
+        self.received_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=1; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class ThreadLocalSessionTest(unittest.TestCase):
+    """
+    Tests the `requests` stand-in mounted into the SDK modules.
+    """
+
+    def test_each_thread_gets_its_own_session(self) -> None:
+        http_session = ThreadLocalSession()
+        worker_sessions = []
+
+        worker = threading.Thread(
+            target=lambda: worker_sessions.append(http_session.session)
+        )
+        worker.start()
+        worker.join()
+
+        self.assertIs(http_session.session, http_session.session)
+        self.assertIsNot(http_session.session, worker_sessions[0])
+
+    def test_cookies_are_not_persisted(self) -> None:
+        server = HTTPServer(("127.0.0.1", 0), _SetCookieHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        http_session = ThreadLocalSession()
+        url = f"http://127.0.0.1:{server.server_port}/"
+        http_session.get(url)
+        http_session.get(url)
+
+        self.assertEqual(_SetCookieHandler.received_cookies, [None, None])
+        self.assertEqual(len(http_session.session.cookies), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+
+from core.resource_sampler import MIN_CPU_SAMPLE_INTERVAL, ResourceSampler
+
+
+class ResourceSamplerTest(unittest.TestCase):
+    """
+    Tests the aggregates collected by `ResourceSampler` without any GPU.
+    """
+
+    def test_short_run_skips_cpu_usage(self) -> None:
+        sampler = ResourceSampler([], period=5.0)
+        sampler.start()
+
+        usage = sampler.stop()
+
+        self.assertEqual(usage.samples, 1)
+        self.assertEqual(usage.cpu_samples, 0)
+        self.assertEqual(usage.mean_cpu_percent, 0.0)
+        self.assertGreater(usage.max_ram_used, 0)
+
+    def test_final_sample_covers_remaining_interval(self) -> None:
+        sampler = ResourceSampler([], period=5.0)
+        sampler.start()
+        time.sleep(MIN_CPU_SAMPLE_INTERVAL * 2)
+
+        usage = sampler.stop()
+
+        self.assertEqual(usage.cpu_samples, 1)
+
+    def test_stop_is_idempotent(self) -> None:
+        sampler = ResourceSampler([], period=5.0)
+        sampler.start()
+
+        usage = sampler.stop()
+
+        self.assertIs(sampler.stop(), usage)
+        self.assertEqual(usage.samples, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
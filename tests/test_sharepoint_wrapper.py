@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+
+from core.config import settings
+from core.sharepoint_wrapper import SharePointApi
+
+
+class UploadFilesTest(unittest.TestCase):
+    """
+    Tests `SharePointApi.upload_files` against a mocked SharePoint client context.
+    """
+
+    def setUp(self) -> None:
+        patcher = mock.patch("core.sharepoint_wrapper.ClientContext")
+        client_context = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.ctx = client_context.return_value.with_credentials.return_value
+        self.folder = self.ctx.web.get_folder_by_server_relative_url.return_value
+
+        self.api = SharePointApi("https://site", "user", "password", "01")
+        self.api.list_folders_by_number = mock.Mock(return_value=["01 - Logs"])
+        self.api._upload_batch = mock.Mock(return_value=[])
+
+        self.target_folder_path = (
+            f"{settings.SHAREPOINT_ROOT_LOG_FOLDER}/01 - Logs/{settings.BOT_NAME}"
+        )
+
+    def _set_remote_files(self, *names: str) -> None:
+        remote_files = []
+        for name in names:
+            remote_file = mock.Mock()
+            remote_file.name = name
+            remote_files.append(remote_file)
+        self.folder.files = remote_files
+
+    def test_uploads_files_to_empty_folder(self) -> None:
+        self._set_remote_files()
+
+        self.api.upload_files(["/logs/bot.log", "/data/report.csv"])
+
+        self.api._upload_batch.assert_called_once_with(
+            self.target_folder_path,
+            [("/logs/bot.log", "bot.log"), ("/data/report.csv", "report.csv")],
+        )
+
+    def test_renames_files_already_in_folder(self) -> None:
+        self._set_remote_files("bot.log", "report.csv")
+
+        self.api.upload_files(["/logs/bot.log", "/data/report.csv"])
+
+        self.api._upload_batch.assert_called_once_with(
+            self.target_folder_path,
+            [("/logs/bot.log", "bot(1).log"), ("/data/report.csv", "report(1).csv")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()